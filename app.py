@@ -1,7 +1,15 @@
 import streamlit as st
 import numpy as np
 import pandas as pd
-from scipy.optimize import linprog
+
+from delivery_core import (
+    DEPOT_LABELS,
+    DISTANCES,
+    STORE_CAPS,
+    STORE_LABELS,
+    TOTAL_DEMAND,
+    solve_delivery,
+)
 
 import streamlit.components.v1 as components
 
@@ -24,17 +32,10 @@ ga_script = f"""
 components.html(ga_script, height=0)
 
 
-# Labels and Data
-depot_labels = ["D1", "D2", "D3"]
-store_labels = ["Store 1", "Store 2", "Store 3"]
-store_caps = [2000, 3000, 2000]
+@st.cache_data
+def distance_table():
+    return pd.DataFrame(DISTANCES, index=DEPOT_LABELS, columns=STORE_LABELS)
 
-distances = np.array([
-    [22, 33, 40],
-    [27, 30, 22],
-    [36, 20, 25],
-])
-cost_per_mile = 5
 
 # --- Input Section ---
 st.markdown("Input the quantity to be delivered:")
@@ -50,80 +51,62 @@ with col1:
 
 with col2:
     st.markdown("Distance table")
-    distance_df = pd.DataFrame(distances, index=depot_labels, columns=store_labels)
-    st.dataframe(distance_df.style.format(precision=0), use_container_width=True)
+    st.dataframe(
+        distance_table(),
+        use_container_width=True,
+        column_config={
+            label: st.column_config.NumberColumn(format="%d") for label in STORE_LABELS
+        },
+    )
 
 # --- Logic Section ---
-if submit:
-    depot_supply = [d1_supply, d2_supply, d3_supply]
-    total_supply = sum(depot_supply)
-    total_demand = sum(store_caps)
+def results_block(d1_supply, d2_supply, d3_supply):
+    """Validate the depot supplies, solve, and render the results."""
+    depot_supply = np.array([d1_supply, d2_supply, d3_supply], dtype=np.int64)
+    total_supply = int(depot_supply.sum())
 
-    if total_supply > total_demand:
+    if total_supply > TOTAL_DEMAND:
         st.error(f"""
-        **Total depot supply ({total_supply}) exceeds store demand ({total_demand}).**  
+        **Total depot supply ({total_supply}) exceeds store demand ({TOTAL_DEMAND}).**  
         Please adjust depot inputs accordingly to avoid over-delivery.
         """)
-        st.stop()
+        return
 
     # --- Optimization ---
-    c = (distances * cost_per_mile).flatten()
-
-    A_store = np.zeros((3, 9))
-    for j in range(3):
-        for i in range(3):
-            A_store[j, 3*i + j] = 1
-    b_store = store_caps
-
-    A_depot = np.zeros((3, 9))
-    for i in range(3):
-        A_depot[i, 3*i : 3*i+3] = 1
-    b_depot = depot_supply
-
-    bounds = [(0, None) for _ in range(9)]
-
-    res = linprog(
-        c=c,
-        A_ub=A_store,
-        b_ub=b_store,
-        A_eq=A_depot,
-        b_eq=b_depot,
-        bounds=bounds,
-        method="highs"
-    )
+    res = solve_delivery(d1_supply, d2_supply, d3_supply)
 
     st.markdown("## Optimisation Results")
 
     if res.success:
-        x = np.round(res.x).astype(int).reshape(3, 3)
-        shipment_df = pd.DataFrame(x, index=depot_labels, columns=store_labels)
+        # res is a fresh copy from the solve cache, so it can be rounded in place
+        x = np.rint(res.x, out=res.x).astype(np.int64).reshape(3, 3)
         store_delivery = x.sum(axis=0)
 
         # Constraint validation
-        if any(store_delivery > store_caps):
+        if (store_delivery > STORE_CAPS).any():
             st.error("Input values are not within scope: at least one store is oversupplied.")
-            st.stop()
+            return
 
         # --- Optimised Schedule Section ---
         st.markdown("###Optimised Schedule")
         schedule_df = pd.DataFrame({
-            "Store": store_labels,
+            "Store": STORE_LABELS,
             "Delivered": store_delivery,
-            "Capacity": store_caps
+            "Capacity": STORE_CAPS
         })
-        st.dataframe(schedule_df.style.set_properties(**{
-            "text-align": "center"
-        }).hide(axis="index"), use_container_width=True)
+        st.dataframe(schedule_df, use_container_width=True, hide_index=True)
 
         # --- Shipment Matrix Section ---
         st.markdown("#### Shipment Breakdown")
-        st.markdown(shipment_df.style.set_table_styles([
-            {'selector': 'th', 'props': [('text-align', 'center')]},
-            {'selector': 'td', 'props': [('text-align', 'center')]},
-        ]).to_html(), unsafe_allow_html=True)
+        shipment_df = pd.DataFrame(x, index=DEPOT_LABELS, columns=STORE_LABELS)
+        st.dataframe(shipment_df, use_container_width=True)
 
         # --- Cost ---
         total_cost = int(res.fun)
         st.write(f"### Total Delivery Cost: £{total_cost:,}")
     else:
         st.error("Optimization failed: " + res.message)
+
+
+if submit:
+    results_block(d1_supply, d2_supply, d3_supply)
@@ -0,0 +1,244 @@
+"""Static delivery data and the schedule solver shared by the Streamlit views."""
+from types import SimpleNamespace
+
+import numpy as np
+import streamlit as st
+from scipy.sparse import csc_matrix
+
+
+# Labels and Data
+DEPOT_LABELS = ["D1", "D2", "D3"]
+STORE_LABELS = ["Store 1", "Store 2", "Store 3"]
+STORE_CAPS = np.array([2000, 3000, 2000], dtype=np.int64)
+TOTAL_DEMAND = int(STORE_CAPS.sum())
+
+DISTANCES = np.array([
+    [22, 33, 40],
+    [27, 30, 22],
+    [36, 20, 25],
+], dtype=np.float64)
+COST_PER_MILE = 5
+
+# Static LP data: cost vector and constraint matrices never change between reruns.
+# Everything handed to linprog is already C-contiguous float64, so the wrapper
+# has nothing to convert; C_VEC is a view of COST, not a copy.
+COST = DISTANCES * COST_PER_MILE
+C_VEC = COST.ravel()
+B_STORE = STORE_CAPS.astype(np.float64)
+
+
+def _constraint_matrices(n_depots, n_stores):
+    """Store-capacity and depot-supply rows for variable n_stores*i + j (depot i -> store j).
+
+    Built directly as CSC so HiGHS skips its dense -> sparse conversion.
+    """
+    n_routes = n_depots * n_stores
+    a_store = csc_matrix(
+        (
+            np.ones(n_routes),
+            (
+                np.repeat(np.arange(n_stores), n_depots),
+                (np.arange(n_stores)[:, None] + n_stores * np.arange(n_depots)).ravel(),
+            ),
+        ),
+        shape=(n_stores, n_routes),
+    )
+    a_depot = csc_matrix(
+        (
+            np.ones(n_routes),
+            (np.repeat(np.arange(n_depots), n_stores), np.arange(n_routes)),
+        ),
+        shape=(n_depots, n_routes),
+    )
+    return a_store, a_depot
+
+
+A_STORE, A_DEPOT = _constraint_matrices(*DISTANCES.shape)
+
+
+@st.cache_resource
+def get_solver():
+    """Import linprog on first use; most solves never leave the transport fast path."""
+    from scipy.optimize import linprog
+    return linprog
+
+
+def solve_transport(supply, demand, cost, max_pivots=10):
+    """Vogel's approximation method improved to optimality with MODI pivots.
+
+    Returns the shipment matrix, or None if supply exceeds demand (infeasible)
+    or no optimum is reached within ``max_pivots`` stepping-stone iterations.
+    """
+    supply = np.asarray(supply, dtype=float)
+    demand = np.asarray(demand, dtype=float)
+    cost = np.asarray(cost, dtype=float)
+    n_depots = len(supply)
+
+    # Depots must ship everything, so supply above total demand is infeasible
+    shortfall = demand.sum() - supply.sum()
+    if shortfall < 0:
+        return None
+    # Stores may be left below capacity: absorb the slack with a zero-cost dummy depot
+    if shortfall > 0:
+        supply = np.append(supply, shortfall)
+        cost = np.vstack([cost, np.zeros(cost.shape[1])])
+    m, n = cost.shape
+
+    # --- Vogel's approximation ---
+    alloc = np.zeros((m, n))
+    s, d = supply.copy(), demand.copy()
+    rows, cols = list(range(m)), list(range(n))
+    while rows and cols:
+        best = None
+        for i in rows:
+            line = sorted(cost[i, j] for j in cols)
+            penalty = line[1] - line[0] if len(line) > 1 else line[0]
+            j = min(cols, key=lambda j: cost[i, j])
+            if best is None or penalty > best[0]:
+                best = (penalty, i, j)
+        for j in cols:
+            line = sorted(cost[i, j] for i in rows)
+            penalty = line[1] - line[0] if len(line) > 1 else line[0]
+            i = min(rows, key=lambda i: cost[i, j])
+            if penalty > best[0]:
+                best = (penalty, i, j)
+
+        _, i, j = best
+        qty = min(s[i], d[j])
+        alloc[i, j] = qty
+        s[i] -= qty
+        d[j] -= qty
+        if s[i] == 0:
+            rows.remove(i)
+        if d[j] == 0:
+            cols.remove(j)
+
+    # --- MODI / stepping-stone ---
+    # Complete the basis to a spanning tree (m + n - 1 cells) so the duals are
+    # fully determined; degenerate cells are taken cheapest first.
+    parent = list(range(m + n))
+
+    def find(k):
+        while parent[k] != k:
+            parent[k] = parent[parent[k]]
+            k = parent[k]
+        return k
+
+    basis = []
+    positive = [(i, j) for i in range(m) for j in range(n) if alloc[i, j] > 0]
+    zero = sorted(
+        ((i, j) for i in range(m) for j in range(n) if alloc[i, j] == 0),
+        key=lambda cell: cost[cell],
+    )
+    for i, j in positive + zero:
+        ri, rj = find(i), find(m + j)
+        if ri != rj:
+            parent[ri] = rj
+            basis.append((i, j))
+        elif alloc[i, j] > 0:
+            return None
+
+    # Nodes 0..m-1 are depots and m..m+n-1 are stores; basic cells are tree edges
+    for _ in range(max_pivots):
+        adjacent = [[] for _ in range(m + n)]
+        for i, j in basis:
+            adjacent[i].append(m + j)
+            adjacent[m + j].append(i)
+
+        # Duals: u_i + v_j = c_ij on every basic cell, walking the tree from depot 0
+        duals = np.zeros(m + n)
+        via = {0: None}
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            for nxt in adjacent[node]:
+                if nxt not in via:
+                    via[nxt] = node
+                    i, j = (node, nxt - m) if node < m else (nxt, node - m)
+                    duals[nxt] = cost[i, j] - duals[node]
+                    stack.append(nxt)
+
+        reduced = cost - duals[:m, None] - duals[None, m:]
+        i, j = np.unravel_index(np.argmin(reduced), reduced.shape)
+        if reduced[i, j] >= -1e-9:
+            return alloc[:n_depots]
+
+        # Tree path store j -> depot i; cells on it alternate -, +, -, ...
+        via = {i: None}
+        stack = [i]
+        while m + j not in via:
+            node = stack.pop()
+            for nxt in adjacent[node]:
+                if nxt not in via:
+                    via[nxt] = node
+                    stack.append(nxt)
+        path = [m + j]
+        while path[-1] != i:
+            path.append(via[path[-1]])
+        cells = [
+            (a, b - m) if a < m else (b, a - m)
+            for a, b in zip(path, path[1:])
+        ]
+        minus, plus = cells[0::2], cells[1::2]
+        leaving = min(minus, key=lambda cell: alloc[cell])
+        theta = alloc[leaving]
+        for cell in minus:
+            alloc[cell] -= theta
+        for cell in plus:
+            alloc[cell] += theta
+        alloc[i, j] = theta
+        basis.remove(leaving)
+        basis.append((i, j))
+
+    return None
+
+
+@st.cache_data(max_entries=128)
+def solve_delivery(d1, d2, d3):
+    """Solve the delivery schedule, using the transport fast path where possible.
+
+    Cached on the depot supplies so resubmitting the same inputs skips the solve.
+    """
+    depot_supply = np.array([d1, d2, d3], dtype=np.float64)
+    stocked = np.flatnonzero(depot_supply)
+
+    # Fast paths only apply to feasible supplies; oversupply falls through to
+    # linprog, which reports it as infeasible
+    x = None
+    if depot_supply.sum() <= TOTAL_DEMAND:
+        if stocked.size == 0:
+            x = np.zeros(COST.shape)
+        elif stocked.size == 1:
+            # A single stocked depot fills the cheapest stores first, which is optimal
+            i = stocked[0]
+            x = np.zeros(COST.shape)
+            remaining = depot_supply[i]
+            for j in np.argsort(COST[i]):
+                x[i, j] = min(remaining, STORE_CAPS[j])
+                remaining -= x[i, j]
+        else:
+            x = solve_transport(depot_supply, STORE_CAPS, COST)
+
+    if x is not None:
+        x = x.ravel()
+        return SimpleNamespace(
+            x=x, fun=float(C_VEC @ x), success=True, status=0,
+            message="Optimal solution found (transportation fast path)."
+        )
+
+    linprog = get_solver()
+    return linprog(
+        c=C_VEC,
+        A_ub=A_STORE,
+        b_ub=B_STORE,
+        A_eq=A_DEPOT,
+        b_eq=depot_supply,
+        bounds=(0, None),
+        # Dual simplex without presolve: presolve is pure overhead on 9 variables
+        method="highs-ds",
+        options={
+            "presolve": False,
+            "dual_feasibility_tolerance": 1e-7,
+            "primal_feasibility_tolerance": 1e-7,
+        },
+    )
@@ -0,0 +1,52 @@
+import itertools
+
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+
+from delivery_core import (
+    A_DEPOT,
+    A_STORE,
+    B_STORE,
+    C_VEC,
+    STORE_CAPS,
+    TOTAL_DEMAND,
+    solve_delivery,
+)
+
+GRID = [0, 500, 1250, 2000, 3000, 3100]
+FEASIBLE = [
+    supply for supply in itertools.product(GRID, repeat=3)
+    if sum(supply) <= TOTAL_DEMAND
+] + [
+    (2000, 3000, 2000),  # balanced: every store filled exactly
+    (7000, 0, 0),
+    (0, 0, 7000),
+    (1, 1, 1),
+]
+INFEASIBLE = [(4000, 4000, 0), (3000, 3000, 3000), (8000, 0, 0)]
+
+
+def reference(supply):
+    return linprog(
+        C_VEC, A_ub=A_STORE, b_ub=B_STORE, A_eq=A_DEPOT, b_eq=supply,
+        bounds=(0, None), method="highs",
+    )
+
+
+@pytest.mark.parametrize("supply", FEASIBLE)
+def test_matches_linprog(supply):
+    res = solve_delivery(*supply)
+    ref = reference(supply)
+
+    assert res.success
+    assert res.fun == pytest.approx(ref.fun)
+    x = np.asarray(res.x).reshape(3, 3)
+    assert (x >= 0).all()
+    np.testing.assert_allclose(x.sum(axis=1), supply)
+    assert (x.sum(axis=0) <= STORE_CAPS).all()
+
+
+@pytest.mark.parametrize("supply", INFEASIBLE)
+def test_oversupply_is_infeasible(supply):
+    assert not solve_delivery(*supply).success